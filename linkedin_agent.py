@@ -19,7 +19,7 @@ def parse_relative_date(date_text):
         date_text: String like "2d", "3h ago", "1w", "edited 5m", etc.
     
     Returns:
-        datetime object representing the parsed date, or None if invalid/too old
+        datetime object representing the parsed date, or None if it can't be parsed
     """
     if not date_text:
         return None
@@ -52,18 +52,31 @@ def parse_relative_date(date_text):
         delta = timedelta(days=number * 7)
     elif unit in ['mo', 'month', 'months']:
         delta = timedelta(days=number * 30)
-    elif unit in ['y', 'yr', 'year', 'years']:
-        # Years are too old for our use case (max 30 days)
-        return None
+    elif unit in ['y', 'yr', 'yrs', 'year', 'years']:
+        delta = timedelta(days=number * 365)
     else:
         return None
     
     return now - delta
 
 
-def get_linkedin_updates(url, max_posts=10, max_days=None, debug=False):
+def iter_linkedin_updates(url, max_posts=10, max_days=None, debug=False):
     """
-    Scrape LinkedIn posts from a Company Page or User Activity feed.
+    Scrape LinkedIn posts from a Company Page or User Activity feed, yielding
+    each post as soon as it has been extracted and passed filtering.
+    
+    Callers can stop iterating early (e.g. once they reach a post they already
+    have) and the browser is closed when the generator is closed. Posts yielded
+    before a later failure are kept by the caller; the error is printed and
+    iteration simply ends.
+    
+    The generator keeps a Playwright sync session open between yields, and
+    Playwright allows only one sync session per thread. Do not call
+    get_linkedin_updates() or start another iter_linkedin_updates() while
+    iterating one on the same thread - the inner call fails and, because
+    errors are caught and printed, shows up as an empty result. Finish (or
+    close) the generator first, or collect posts with list() and then scrape
+    the next URL.
     
     Args:
         url: LinkedIn URL (company page or user activity feed)
@@ -71,10 +84,12 @@ def get_linkedin_updates(url, max_posts=10, max_days=None, debug=False):
         max_days: Optional - Maximum age of posts to include (default: None, disabled)
         debug: If True, saves HTML structure to debug.html (default: False)
     
-    Returns:
-        List of dictionaries with keys: 'position', 'text', 'url'
+    Yields:
+        Dictionaries with keys: 'position', 'text', 'url', 'urn', 'posted_at'
+        ('posted_at' is an approximate datetime parsed from LinkedIn's relative
+        timestamp, or None if it could not be found or parsed)
     """
-    posts = []
+    post_count = 0
     seen_content = set()  # Track seen content to avoid duplicates
     seen_urns = set()  # Track unique post URNs to avoid processing same post twice
     cutoff_date = datetime.now() - timedelta(days=max_days) if max_days else None
@@ -96,10 +111,10 @@ def get_linkedin_updates(url, max_posts=10, max_days=None, debug=False):
                     context.add_cookies(cookies)
             except FileNotFoundError:
                 print("Warning: linkedin_cookies.json not found. Scraping may fail without authentication.")
-                return []
+                return
             except json.JSONDecodeError:
                 print("Warning: linkedin_cookies.json is not valid JSON. Scraping may fail.")
-                return []
+                return
             
             page = context.new_page()
             
@@ -235,12 +250,12 @@ def get_linkedin_updates(url, max_posts=10, max_days=None, debug=False):
             if not post_elements:
                 print("Warning: No posts found with any selector strategy")
                 browser.close()
-                return []
+                return
             
             # Process each post
             for idx, post_element in enumerate(post_elements):
                 # Stop if we've reached our target
-                if len(posts) >= max_posts:
+                if post_count >= max_posts:
                     print(f"\nReached target of {max_posts} posts. Stopping.")
                     break
                 
@@ -269,8 +284,28 @@ def get_linkedin_updates(url, max_posts=10, max_days=None, debug=False):
                             print(f"  Skipping post {idx + 1}: repost")
                         continue
                     
-                    # Skip date extraction - just get posts in order
+                    # Extract relative post date (e.g. "2d", "3h ago") from the actor sub-description
                     post_date = None
+                    date_selectors = [
+                        '.update-components-actor__sub-description',
+                        '.feed-shared-actor__sub-description',
+                        'time',
+                    ]
+                    
+                    for selector in date_selectors:
+                        try:
+                            date_elem = post_element.query_selector(selector)
+                            if date_elem:
+                                post_date = parse_relative_date(date_elem.inner_text())
+                                if post_date:
+                                    break
+                        except:
+                            continue
+                    
+                    if cutoff_date and post_date and post_date < cutoff_date:
+                        if debug:
+                            print(f"  Skipping post {idx + 1}: older than {max_days} days")
+                        continue
                     
                     # Extract text content - try to get main post content
                     text_content = None
@@ -343,6 +378,7 @@ def get_linkedin_updates(url, max_posts=10, max_days=None, debug=False):
                     if debug:
                         print(f"\nPost {idx + 1} analysis:")
                         print(f"  URN: {post_urn[:80] if post_urn else 'N/A'}")
+                        print(f"  Posted: {post_date.strftime('%Y-%m-%d %H:%M') if post_date else 'N/A'}")
                         print(f"  Content length: {len(text_content) if text_content else 0}")
                         print(f"  First 100 chars: {text_content[:100] if text_content else 'N/A'}")
                     
@@ -372,14 +408,17 @@ def get_linkedin_updates(url, max_posts=10, max_days=None, debug=False):
                     
                     # If we have valid content, add to posts
                     if text_content and len(text_content.strip()) > 20:
-                        posts.append({
-                            'position': len(posts) + 1,
-                            'text': text_content,
-                            'url': post_url or url
-                        })
+                        post_count += 1
                         # Show first 60 chars of content
                         content_preview = text_content[:60].replace('\n', ' ') + '...' if len(text_content) > 60 else text_content.replace('\n', ' ')
-                        print(f"✓ Post {len(posts)}: {content_preview}")
+                        print(f"✓ Post {post_count}: {content_preview}")
+                        yield {
+                            'position': post_count,
+                            'text': text_content,
+                            'url': post_url or url,
+                            'urn': post_urn,
+                            'posted_at': post_date
+                        }
                 
                 except Exception as e:
                     print(f"Error processing post {idx + 1}: {e}")
@@ -389,10 +428,30 @@ def get_linkedin_updates(url, max_posts=10, max_days=None, debug=False):
     
     except Exception as e:
         print(f"Error during scraping: {e}")
-        return []
+        if post_count:
+            print(f"Keeping {post_count} post(s) extracted before the error")
+        return
+    
+    print(f"\nTotal posts extracted: {post_count}")
+
+
+def get_linkedin_updates(url, max_posts=10, max_days=None, debug=False):
+    """
+    Scrape LinkedIn posts from a Company Page or User Activity feed.
+    
+    Thin wrapper around iter_linkedin_updates() that collects every post.
+    Posts extracted before an error are returned rather than discarded.
     
-    print(f"\nTotal posts extracted: {len(posts)}")
-    return posts
+    Args:
+        url: LinkedIn URL (company page or user activity feed)
+        max_posts: Maximum number of posts to extract (default: 10)
+        max_days: Optional - Maximum age of posts to include (default: None, disabled)
+        debug: If True, saves HTML structure to debug.html (default: False)
+    
+    Returns:
+        List of dictionaries with keys: 'position', 'text', 'url', 'urn', 'posted_at'
+    """
+    return list(iter_linkedin_updates(url, max_posts=max_posts, max_days=max_days, debug=debug))
 
 
 if __name__ == "__main__":
@@ -403,5 +462,8 @@ if __name__ == "__main__":
     print("\nUsage:")
     print("  from linkedin_agent import get_linkedin_updates")
     print("  posts = get_linkedin_updates('https://www.linkedin.com/company/openai/posts/', max_posts=10)")
+    print("\nOr stream posts as they are extracted:")
+    print("  from linkedin_agent import iter_linkedin_updates")
+    print("  for post in iter_linkedin_updates(url, max_posts=10): ...")
     print("\nOr use scrape_linkedin.py to scrape multiple URLs from linkedin_urls.json")
 
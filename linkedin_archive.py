@@ -0,0 +1,177 @@
+"""
+LinkedIn Archive Module
+Compact post records and columnar (Arrow IPC / Parquet) export of scrape results.
+Requires pyarrow for export/import: pip install -r requirements-archive.txt
+"""
+
+import os
+import sys
+from datetime import datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+class PostRecord:
+    """
+    A single scraped post.
+
+    Uses __slots__ so millions of records don't each carry a __dict__, and
+    interns the company name since it repeats across a run. from_post() also
+    interns the URL when it is the feed-URL fallback rather than a permalink.
+
+    Fields:
+        urn: LinkedIn activity URN (str or None)
+        company: Company/Person name (str)
+        url: Post permalink, or the feed URL when no permalink was found (str)
+        text: Post content (str)
+        position: Position in the feed, starting at 1 (int)
+        scraped_at: When the post was scraped (datetime)
+        posted_at: When the post was published, if known (datetime or None)
+    """
+
+    __slots__ = ('urn', 'company', 'url', 'text', 'position', 'scraped_at', 'posted_at')
+
+    def __init__(self, urn, company, url, text, position, scraped_at, posted_at=None):
+        self.urn = urn
+        self.company = sys.intern(company)
+        self.url = url
+        self.text = text
+        self.position = position
+        self.scraped_at = scraped_at
+        self.posted_at = posted_at
+
+    @classmethod
+    def from_post(cls, post, company, scraped_at=None, feed_url=None):
+        """
+        Build a record from a post dictionary returned by linkedin_agent.
+
+        Args:
+            post: Dictionary with keys 'position', 'text', 'url' and optionally 'urn', 'posted_at'
+            company: Company/Person name the post was scraped for
+            scraped_at: Scrape time (default: now)
+            feed_url: URL that was scraped; posts without a permalink fall back
+                      to it, so it is interned when it appears as the post URL
+        """
+        url = post['url']
+        if feed_url and url == feed_url:
+            url = sys.intern(url)
+        return cls(
+            urn=post.get('urn'),
+            company=company,
+            url=url,
+            text=post['text'],
+            position=post['position'],
+            scraped_at=scraped_at or datetime.now(),
+            posted_at=post.get('posted_at'),
+        )
+
+    def to_dict(self):
+        """Return the record as a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        if not isinstance(other, PostRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"PostRecord(urn={self.urn!r}, company={self.company!r}, position={self.position!r})"
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow is required for columnar export. Install it with: pip install -r requirements-archive.txt")
+
+
+def _schema():
+    return pa.schema([
+        ('urn', pa.string()),
+        ('company', pa.dictionary(pa.int32(), pa.string())),
+        ('url', pa.string()),
+        ('text', pa.string()),
+        ('position', pa.int32()),
+        ('scraped_at', pa.timestamp('us')),
+        ('posted_at', pa.timestamp('us')),
+    ])
+
+
+def _is_parquet(path):
+    return os.path.splitext(path)[1].lower() in ('.parquet', '.pq')
+
+
+def posts_to_table(records):
+    """
+    Convert PostRecords into a pyarrow Table.
+
+    The company column is dictionary-encoded so repeated names are stored once.
+    """
+    _require_pyarrow()
+    schema = _schema()
+    columns = {name: [] for name in PostRecord.__slots__}
+    for record in records:
+        for name in PostRecord.__slots__:
+            columns[name].append(getattr(record, name))
+    arrays = [pa.array(columns[field.name], type=field.type) for field in schema]
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def write_posts(records, path):
+    """
+    Write PostRecords to a columnar file.
+
+    Args:
+        records: Iterable of PostRecord
+        path: Output path. '.parquet' writes Parquet, anything else (e.g. '.arrow')
+              writes an Arrow IPC file that can be memory-mapped on read.
+    """
+    table = posts_to_table(records)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if _is_parquet(path):
+        pq.write_table(table, path)
+    else:
+        with pa.OSFile(path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+
+def read_posts_table(path):
+    """
+    Read a columnar post file into a pyarrow Table.
+
+    Arrow IPC files are memory-mapped, so columns are only paged in when used.
+    The returned table keeps the mapping alive; the file handle itself is closed
+    before returning, so reading many files in a loop does not leak handles.
+    """
+    _require_pyarrow()
+    if _is_parquet(path):
+        return pq.read_table(path, memory_map=True)
+    with pa.memory_map(path, 'r') as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def read_posts(path):
+    """
+    Read a columnar post file back into a list of PostRecords.
+
+    For large archives prefer read_posts_table() and work with the columns directly.
+    """
+    table = read_posts_table(path)
+    return [PostRecord(**row) for row in table.to_pylist()]
+
+
+if __name__ == "__main__":
+    # Example usage
+    print("LinkedIn Archive Module")
+    print("=" * 60)
+    print("Usage:")
+    print("  from linkedin_archive import read_posts_table")
+    print("  table = read_posts_table('linkedin_archive/posts_20241205_103000_123456_4242.arrow')")
+    print("  df = table.to_pandas()")
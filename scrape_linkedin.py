@@ -4,117 +4,198 @@ Reads company names and URLs from linkedin_urls.json and outputs results to link
 """
 
 import json
+import os
 from datetime import datetime
 from linkedin_agent import get_linkedin_updates
+from linkedin_archive import PostRecord, write_posts
 
-def scrape_and_save():
+def load_companies(path='linkedin_urls.json'):
     """
-    Read company data from linkedin_urls.json, scrape each one, and save results to linkedin_output.txt
+    Read and validate company data from a JSON file.
     Format: [["Company Name", "URL"], ["Company Name 2", "URL2"], ...]
+    
+    Returns:
+        List of [company_name, url] pairs, or None if the file is missing or invalid
     """
-    # Read company data from JSON file
     try:
-        with open('linkedin_urls.json', 'r') as f:
+        with open(path, 'r') as f:
             companies = json.load(f)
     except FileNotFoundError:
-        print("Error: linkedin_urls.json not found!")
-        print("Please create linkedin_urls.json with format: [[\"Company Name\", \"URL\"], ...]")
-        return
+        print(f"Error: {path} not found!")
+        print(f"Please create {path} with format: [[\"Company Name\", \"URL\"], ...]")
+        return None
     except json.JSONDecodeError:
-        print("Error: linkedin_urls.json is not valid JSON!")
-        return
+        print(f"Error: {path} is not valid JSON!")
+        return None
     
     if not companies:
-        print("Error: linkedin_urls.json is empty!")
-        return
+        print(f"Error: {path} is empty!")
+        return None
     
     if not isinstance(companies, list):
-        print("Error: linkedin_urls.json should contain a list of [company_name, url] pairs!")
-        return
+        print(f"Error: {path} should contain a list of [company_name, url] pairs!")
+        return None
     
     # Validate format
     for item in companies:
         if not isinstance(item, list) or len(item) != 2:
             print("Error: Each entry should be [\"Company Name\", \"URL\"]")
             print(f"Invalid entry: {item}")
-            return
+            return None
+    
+    return companies
+
+def format_report_header(company_count):
+    """Return the opening lines of the text report."""
+    return [
+        "=" * 80,
+        "LINKEDIN SCRAPING RESULTS",
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Total Companies: {company_count}",
+        "=" * 80,
+        "",
+    ]
+
+def format_company_section(company_name, url, posts, scraped_at, error=None):
+    """
+    Return the report lines for one company.
+    
+    Args:
+        company_name: Company/Person name
+        url: LinkedIn URL that was scraped
+        posts: List of post dictionaries from get_linkedin_updates
+        scraped_at: datetime the company was scraped
+        error: Error message if scraping failed (default: None)
+    """
+    output_lines = []
+    output_lines.append("")
+    output_lines.append("█" * 80)
+    output_lines.append(f"COMPANY: {company_name.upper()}")
+    output_lines.append("█" * 80)
+    output_lines.append(f"URL: {url}")
+    output_lines.append(f"Scraped: {scraped_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    output_lines.append("─" * 80)
+    output_lines.append("")
+    
+    if error:
+        output_lines.append(f"❌ ERROR: {error}")
+        output_lines.append("")
+    elif posts:
+        output_lines.append(f"📊 Total Posts Found: {len(posts)}")
+        output_lines.append("")
+        
+        for post_idx, post in enumerate(posts, 1):
+            output_lines.append(f"┌─ POST #{post_idx} " + "─" * 66)
+            output_lines.append(f"│ Position in feed: {post.get('position', post_idx)}")
+            if post.get('url') and post['url'] != url:
+                output_lines.append(f"│ Post URL: {post['url']}")
+            output_lines.append("│")
+            output_lines.append("│ Content:")
+            # Indent the content
+            content_lines = post.get('text', 'N/A').split('\n')
+            for line in content_lines:
+                output_lines.append(f"│ {line}")
+            output_lines.append("└" + "─" * 79)
+            output_lines.append("")
+    else:
+        output_lines.append("⚠️  No posts found.")
+        output_lines.append("")
+    
+    return output_lines
+
+def format_report_footer():
+    """Return the closing lines of the text report."""
+    return [
+        "",
+        "=" * 80,
+        "END OF REPORT",
+        "=" * 80,
+    ]
+
+def save_report(output_lines, output_file='linkedin_output.txt'):
+    """Write the report lines to output_file."""
+    try:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(output_lines))
+        print(f"\n{'=' * 80}")
+        print(f"✓ Results saved to {output_file}")
+        print(f"{'=' * 80}")
+    except Exception as e:
+        print(f"\n✗ Error saving to file: {e}")
+
+def save_archive(records, archive_dir, run_started):
+    """
+    Write this run's PostRecords to archive_dir as an Arrow IPC file.
+    Skipped if there are no records, or with a warning if pyarrow is not installed.
+    The file name includes microseconds and the process ID so runs never overwrite each other.
+    """
+    if not records:
+        print("⚠️  No posts to archive, skipping archive export")
+        return
+    
+    archive_file = os.path.join(archive_dir, f"posts_{run_started.strftime('%Y%m%d_%H%M%S_%f')}_{os.getpid()}.arrow")
+    try:
+        write_posts(records, archive_file)
+        print(f"✓ Archived {len(records)} posts to {archive_file}")
+    except ImportError as e:
+        print(f"⚠️  Skipping archive export: {e}")
+    except Exception as e:
+        print(f"✗ Error writing archive: {e}")
+
+def scrape_and_save(archive_dir='linkedin_archive'):
+    """
+    Read company data from linkedin_urls.json, scrape each one, and save results to linkedin_output.txt
+    Format: [["Company Name", "URL"], ["Company Name 2", "URL2"], ...]
+    
+    Args:
+        archive_dir: Directory to write this run's posts to as an Arrow IPC file
+                     (default: 'linkedin_archive'). Set to None to skip. Skipped
+                     with a warning if pyarrow is not installed.
+    """
+    companies = load_companies()
+    if companies is None:
+        return
     
     print(f"Found {len(companies)} compan{'y' if len(companies) == 1 else 'ies'} to scrape")
     print("=" * 80)
     
     # Prepare output
-    output_lines = []
-    output_lines.append("=" * 80)
-    output_lines.append("LINKEDIN SCRAPING RESULTS")
-    output_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    output_lines.append(f"Total Companies: {len(companies)}")
-    output_lines.append("=" * 80)
-    output_lines.append("")
+    run_started = datetime.now()
+    records = []
+    output_lines = format_report_header(len(companies))
     
     # Process each company
     for idx, (company_name, url) in enumerate(companies, 1):
         print(f"\n[{idx}/{len(companies)}] Scraping: {company_name}")
         print(f"  URL: {url}")
         
-        output_lines.append("")
-        output_lines.append("█" * 80)
-        output_lines.append(f"COMPANY: {company_name.upper()}")
-        output_lines.append("█" * 80)
-        output_lines.append(f"URL: {url}")
-        output_lines.append(f"Scraped: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        output_lines.append("─" * 80)
-        output_lines.append("")
-        
+        scraped_at = datetime.now()
+        posts = []
+        error = None
         try:
             posts = get_linkedin_updates(url, max_posts=10)
+            records.extend(PostRecord.from_post(post, company_name, scraped_at, feed_url=url) for post in posts)
             
             if posts:
-                output_lines.append(f"📊 Total Posts Found: {len(posts)}")
-                output_lines.append("")
-                
-                for post_idx, post in enumerate(posts, 1):
-                    output_lines.append(f"┌─ POST #{post_idx} " + "─" * 66)
-                    output_lines.append(f"│ Position in feed: {post.get('position', post_idx)}")
-                    if post.get('url') and post['url'] != url:
-                        output_lines.append(f"│ Post URL: {post['url']}")
-                    output_lines.append("│")
-                    output_lines.append("│ Content:")
-                    # Indent the content
-                    content_lines = post.get('text', 'N/A').split('\n')
-                    for line in content_lines:
-                        output_lines.append(f"│ {line}")
-                    output_lines.append("└" + "─" * 79)
-                    output_lines.append("")
-                
                 print(f"  ✓ Extracted {len(posts)} posts from {company_name}")
             else:
-                output_lines.append("⚠️  No posts found.")
-                output_lines.append("")
                 print(f"  ⚠️  No posts found for {company_name}")
         
         except Exception as e:
-            error_msg = f"Error scraping {company_name}: {str(e)}"
-            print(f"  ✗ {error_msg}")
-            output_lines.append(f"❌ ERROR: {error_msg}")
-            output_lines.append("")
+            error = f"Error scraping {company_name}: {str(e)}"
+            print(f"  ✗ {error}")
+        
+        output_lines.extend(format_company_section(company_name, url, posts, scraped_at, error))
     
     # Add summary at the end
-    output_lines.append("")
-    output_lines.append("=" * 80)
-    output_lines.append("END OF REPORT")
-    output_lines.append("=" * 80)
+    output_lines.extend(format_report_footer())
     
     # Write to output file
-    output_file = 'linkedin_output.txt'
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(output_lines))
-        print(f"\n{'=' * 80}")
-        print(f"✓ Results saved to {output_file}")
-        print(f"{'=' * 80}")
-    except Exception as e:
-        print(f"\n✗ Error saving to file: {e}")
+    save_report(output_lines)
+    
+    # Write columnar archive for this run
+    if archive_dir:
+        save_archive(records, archive_dir, run_started)
 
 if __name__ == "__main__":
     scrape_and_save()
-
@@ -0,0 +1,311 @@
+"""
+Multi-process sharded scraper for large company lists.
+Splits linkedin_urls.json into shards, scrapes each shard in its own worker process
+(each with its own browser), and merges the results into linkedin_output.txt in the
+original list order.
+"""
+
+import multiprocessing
+import time
+from collections import deque
+from datetime import datetime
+from multiprocessing.connection import wait
+from linkedin_agent import get_linkedin_updates
+from linkedin_archive import PostRecord
+from scrape_linkedin import (
+    load_companies,
+    format_report_header,
+    format_company_section,
+    format_report_footer,
+    save_report,
+    save_archive,
+)
+
+
+# Each worker opens a visible (non-headless) browser, and with the shared rate
+# budget only about (time to scrape one company / min_interval) workers can be
+# busy at once; a company takes roughly 20-30s, so ~4-6 workers at 5s.
+DEFAULT_WORKERS = 4
+
+
+class SharedRateLimiter:
+    """
+    Rate budget shared by every worker process.
+
+    Hands out page-load slots at least min_interval seconds apart across all
+    shards, so adding workers does not increase the request rate to LinkedIn.
+    """
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._next_slot = multiprocessing.Value('d', 0.0)
+
+    def wait(self):
+        """Block until this process may start its next page load."""
+        lock = self._next_slot.get_lock()
+        # A worker killed while holding the lock would otherwise block everyone
+        if not lock.acquire(timeout=10):
+            time.sleep(self.min_interval)
+            return
+        try:
+            now = time.time()
+            slot = max(now, self._next_slot.value)
+            self._next_slot.value = slot + self.min_interval
+        finally:
+            lock.release()
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def split_into_shards(companies, shard_size):
+    """
+    Split companies into shards of (index, company_name, url) tuples.
+
+    The index is the company's position in the original list and is used to
+    merge results back in order.
+    """
+    items = [(index, company_name, url) for index, (company_name, url) in enumerate(companies)]
+    return [items[start:start + shard_size] for start in range(0, len(items), shard_size)]
+
+
+def _worker(worker_id, conn, limiter, max_posts, scrape):
+    """
+    Worker process loop: receive a shard from the parent over this worker's own
+    pipe, scrape each company in order, and send each result back as soon as it
+    is done so completed work survives a later crash.
+    """
+    while True:
+        try:
+            items = conn.recv()
+        except EOFError:
+            break
+        if items is None:
+            break
+
+        for index, company_name, url in items:
+            limiter.wait()
+            print(f"[worker {worker_id}] Scraping: {company_name}")
+            scraped_at = datetime.now()
+            posts = []
+            error = None
+            try:
+                posts = scrape(url, max_posts=max_posts)
+            except Exception as e:
+                error = f"Error scraping {company_name}: {str(e)}"
+                print(f"[worker {worker_id}] ✗ {error}")
+            conn.send(('result', (index, posts, scraped_at, error)))
+        conn.send(('done', None))
+
+
+def run_sharded(companies, workers=DEFAULT_WORKERS, shard_size=None, min_interval=5.0, max_posts=10,
+                max_attempts=3, company_timeout=300, scrape=get_linkedin_updates):
+    """
+    Scrape companies across multiple worker processes.
+
+    The parent owns shard assignment: each worker has its own pipe and is only
+    sent a shard when it is idle, so a dying worker cannot take queued work with
+    it. When a worker dies (or is stopped by the watchdog), the company it was
+    scraping is charged one attempt, and it plus the rest of its shard are
+    requeued. Only a company that keeps killing its worker is given up on.
+
+    Args:
+        companies: List of [company_name, url] pairs
+        workers: Number of worker processes, each with its own visible browser
+                 (default: DEFAULT_WORKERS). More than about (seconds to scrape one
+                 company / min_interval) just leaves workers waiting on the rate budget.
+        shard_size: Companies per shard (default: split evenly across workers)
+        min_interval: Minimum seconds between page loads across all workers (default: 5.0)
+        max_posts: Maximum number of posts to extract per company (default: 10)
+        max_attempts: How many times a company may crash or time out its worker
+                      before it is reported as failed (default: 3)
+        company_timeout: Seconds a worker may spend on one company, including the
+                         rate-limit wait, before it is terminated (default: 300)
+        scrape: Function called as scrape(url, max_posts=...) in the workers; must be
+                picklable (default: get_linkedin_updates)
+
+    Returns:
+        List of (posts, scraped_at, error) tuples in the same order as companies
+    """
+    if not companies:
+        return []
+
+    workers = max(1, workers or DEFAULT_WORKERS)
+    if not shard_size:
+        shard_size = max(1, -(-len(companies) // workers))
+    pending = deque(split_into_shards(companies, shard_size))
+    workers = min(workers, len(pending))
+
+    limiter = SharedRateLimiter(min_interval)
+    results = {}
+    attempts = {}  # index -> number of times this company crashed or timed out a worker
+    processes = {}  # worker_id -> Process
+    conns = {}  # worker_id -> parent end of the worker's pipe
+    assignments = {}  # worker_id -> list of (index, company_name, url) sent to it
+    last_progress = {}  # worker_id -> time the current company started
+    next_worker_id = 0
+
+    def start_worker():
+        nonlocal next_worker_id
+        worker_id = next_worker_id
+        next_worker_id += 1
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=_worker,
+            args=(worker_id, child_conn, limiter, max_posts, scrape),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()  # So the parent sees EOF when the worker dies
+        processes[worker_id] = process
+        conns[worker_id] = parent_conn
+        print(f"Started worker {worker_id} (pid {process.pid})")
+
+    def record_result(index, posts, scraped_at, error):
+        if index in results:
+            return  # Already have this company from an earlier attempt
+        results[index] = (posts, scraped_at, error)
+        company_name = companies[index][0]
+        if error:
+            print(f"[{len(results)}/{len(companies)}] ✗ {company_name}")
+        else:
+            print(f"[{len(results)}/{len(companies)}] ✓ {company_name}: {len(posts)} posts")
+
+    def handle_message(worker_id, kind, payload):
+        if kind == 'result':
+            record_result(*payload)
+            last_progress[worker_id] = time.time()
+        elif kind == 'done':
+            assignments.pop(worker_id, None)
+
+    def dispatch():
+        for worker_id, conn in conns.items():
+            if worker_id in assignments or not pending:
+                continue
+            items = pending.popleft()
+            assignments[worker_id] = items
+            last_progress[worker_id] = time.time()
+            try:
+                conn.send(items)
+            except OSError:
+                pass  # Worker already gone; reaped below and the shard requeued
+
+    def reap(worker_id, reason=None):
+        process = processes[worker_id]
+        conn = conns[worker_id]
+        if process.is_alive():
+            process.terminate()
+        process.join(timeout=5)
+
+        # Collect results the worker sent before dying so finished work isn't redone
+        # and the crash is charged to the company it was actually scraping
+        while True:
+            try:
+                if not conn.poll():
+                    break
+                handle_message(worker_id, *conn.recv())
+            except Exception:
+                break  # EOF, or a message cut short by the crash
+
+        del processes[worker_id]
+        del conns[worker_id]
+        last_progress.pop(worker_id, None)
+        conn.close()
+        print(f"✗ Worker {worker_id} {reason or f'exited (code {process.exitcode})'}")
+
+        remaining = [item for item in assignments.pop(worker_id, []) if item[0] not in results]
+        if not remaining:
+            return
+
+        # Workers scrape their shard in order, so the first unfinished company is the one it died on
+        index, company_name, url = remaining[0]
+        attempts[index] = attempts.get(index, 0) + 1
+        if attempts[index] >= max_attempts:
+            print(f"✗ Giving up on {company_name} after {attempts[index]} attempts")
+            record_result(index, [], datetime.now(), f"Error scraping {company_name}: worker process died or timed out")
+            remaining = remaining[1:]
+        if remaining:
+            pending.appendleft(remaining)
+            print(f"  Reassigning {len(remaining)} unfinished compan{'y' if len(remaining) == 1 else 'ies'}")
+
+    for _ in range(workers):
+        start_worker()
+
+    try:
+        while len(results) < len(companies):
+            dispatch()
+
+            ready = wait(list(conns.values()), timeout=1.0)
+            for worker_id, conn in list(conns.items()):
+                if conn not in ready:
+                    continue
+                try:
+                    message = conn.recv()
+                except Exception:
+                    reap(worker_id)  # EOF, or a message cut short by the crash
+                    continue
+                handle_message(worker_id, *message)
+
+            # Watchdog: stop workers stuck on one company, and catch deaths without EOF
+            now = time.time()
+            for worker_id, process in list(processes.items()):
+                if not process.is_alive():
+                    reap(worker_id)
+                elif worker_id in assignments and now - last_progress[worker_id] > company_timeout:
+                    reap(worker_id, f"timed out after {company_timeout}s on one company")
+
+            # Replace lost workers while there is queued work
+            while pending and len(processes) < workers:
+                start_worker()
+    finally:
+        for conn in conns.values():
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+        for process in processes.values():
+            process.join(timeout=30)
+            if process.is_alive():
+                process.terminate()
+
+    return [results[index] for index in range(len(companies))]
+
+
+def scrape_sharded_and_save(workers=DEFAULT_WORKERS, shard_size=None, min_interval=5.0, archive_dir='linkedin_archive'):
+    """
+    Read company data from linkedin_urls.json, scrape it across worker processes,
+    and save a single merged report to linkedin_output.txt.
+
+    Args:
+        workers: Number of worker processes, each with its own visible browser
+                 (default: DEFAULT_WORKERS). See run_sharded() for how to choose it.
+        shard_size: Companies per shard (default: split evenly across workers)
+        min_interval: Minimum seconds between page loads across all workers (default: 5.0)
+        archive_dir: Directory to write this run's posts to as an Arrow IPC file
+                     (default: 'linkedin_archive'). Set to None to skip.
+    """
+    companies = load_companies()
+    if companies is None:
+        return
+
+    print(f"Found {len(companies)} compan{'y' if len(companies) == 1 else 'ies'} to scrape")
+    print("=" * 80)
+
+    run_started = datetime.now()
+    results = run_sharded(companies, workers=workers, shard_size=shard_size, min_interval=min_interval)
+
+    # Merge per-shard results in the original list order
+    records = []
+    output_lines = format_report_header(len(companies))
+    for (company_name, url), (posts, scraped_at, error) in zip(companies, results):
+        records.extend(PostRecord.from_post(post, company_name, scraped_at, feed_url=url) for post in posts)
+        output_lines.extend(format_company_section(company_name, url, posts, scraped_at, error))
+    output_lines.extend(format_report_footer())
+
+    save_report(output_lines)
+
+    if archive_dir:
+        save_archive(records, archive_dir, run_started)
+
+
+if __name__ == "__main__":
+    scrape_sharded_and_save()
@@ -0,0 +1,209 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import linkedin_agent
+from linkedin_agent import get_linkedin_updates, iter_linkedin_updates, parse_relative_date
+
+
+FEED_URL = "https://www.linkedin.com/company/acme/posts/"
+
+
+class FakeElement:
+    def __init__(self, text=None, href=None):
+        self.text = text
+        self.href = href
+
+    def inner_text(self):
+        return self.text
+
+    def get_attribute(self, name):
+        return self.href if name == 'href' else None
+
+
+class FakePost:
+    """A post container; records when its content is read so laziness can be checked."""
+
+    def __init__(self, session, number, date_text=None):
+        self.session = session
+        self.number = number
+        self.urn = f"urn:li:activity:{number}"
+        self.text = f"Post number {number} with enough text to pass the length filter"
+        self.date_text = date_text
+
+    def get_attribute(self, name):
+        return self.urn if name == 'data-urn' else None
+
+    def inner_text(self):
+        self.session.read.append(self.number)
+        return self.text
+
+    def query_selector(self, selector):
+        if selector == '.update-components-actor__sub-description' and self.date_text:
+            return FakeElement(self.date_text)
+        if selector == '.feed-shared-update-v2__description':
+            return FakeElement(self.text)
+        if selector == 'a[href*="/feed/update/"]':
+            return FakeElement(href=f"/feed/update/{self.urn}/")
+        return None
+
+
+class FakeMouse:
+    def wheel(self, x, y):
+        pass
+
+
+class FakePage:
+    def __init__(self, session):
+        self.session = session
+        self.mouse = FakeMouse()
+
+    def goto(self, url, **kwargs):
+        pass
+
+    def query_selector(self, selector):
+        return None
+
+    def query_selector_all(self, selector):
+        if selector == '[data-urn*="urn:li:activity"]':
+            return self.session.posts
+        return []
+
+
+class FakeBrowser:
+    def __init__(self, session):
+        self.session = session
+
+    def new_context(self, **kwargs):
+        return self
+
+    def add_cookies(self, cookies):
+        pass
+
+    def new_page(self):
+        return FakePage(self.session)
+
+    def close(self):
+        if self.session.fail_on_close:
+            raise RuntimeError("browser crashed")
+
+
+class FakeSession:
+    """Stands in for sync_playwright(); tracks whether the session is open."""
+
+    def __init__(self, post_count=3, dates=None, fail_on_close=False):
+        dates = dates or [None] * post_count
+        self.posts = [FakePost(self, number, dates[number - 1]) for number in range(1, post_count + 1)]
+        self.read = []
+        self.fail_on_close = fail_on_close
+        self.is_open = False
+        self.was_closed = False
+        self.chromium = self
+
+    def __call__(self):
+        return self
+
+    def __enter__(self):
+        self.is_open = True
+        return self
+
+    def __exit__(self, *exc_info):
+        self.is_open = False
+        self.was_closed = True
+        return False
+
+    def launch(self, **kwargs):
+        return FakeBrowser(self)
+
+
+@pytest.fixture
+def fake_session(monkeypatch, tmp_path):
+    def install(**kwargs):
+        session = FakeSession(**kwargs)
+        monkeypatch.setattr(linkedin_agent, 'sync_playwright', session)
+        return session
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'linkedin_cookies.json').write_text('[]')
+    monkeypatch.setattr(linkedin_agent.time, 'sleep', lambda seconds: None)
+    return install
+
+
+def test_yields_posts_one_at_a_time(fake_session):
+    session = fake_session(post_count=3)
+
+    posts = iter_linkedin_updates(FEED_URL, max_posts=10)
+    first = next(posts)
+
+    assert first['position'] == 1
+    assert first['urn'] == "urn:li:activity:1"
+    assert first['url'] == "https://www.linkedin.com/feed/update/urn:li:activity:1/"
+    # Later posts have not been looked at yet
+    assert 2 not in session.read and 3 not in session.read
+    assert session.is_open
+
+    assert [post['position'] for post in posts] == [2, 3]
+
+
+def test_breaking_early_closes_session(fake_session):
+    session = fake_session(post_count=3)
+
+    for post in iter_linkedin_updates(FEED_URL, max_posts=10):
+        break
+
+    assert session.was_closed and not session.is_open
+    assert 2 not in session.read
+
+
+def test_posts_before_later_error_are_kept(fake_session):
+    fake_session(post_count=2, fail_on_close=True)
+
+    posts = get_linkedin_updates(FEED_URL, max_posts=10)
+
+    assert [post['position'] for post in posts] == [1, 2]
+
+
+def test_list_wrapper_matches_generator(fake_session):
+    fake_session(post_count=4)
+    expected = list(iter_linkedin_updates(FEED_URL, max_posts=3))
+
+    fake_session(post_count=4)
+    assert get_linkedin_updates(FEED_URL, max_posts=3) == expected
+    assert len(expected) == 3
+
+
+@pytest.mark.parametrize("date_text, expected", [
+    ("5m", timedelta(minutes=5)),
+    ("3h ago", timedelta(hours=3)),
+    ("2d • Edited •", timedelta(days=2)),
+    ("edited 1w", timedelta(weeks=1)),
+    ("3mo", timedelta(days=90)),
+    ("1yr", timedelta(days=365)),
+    ("2 years ago", timedelta(days=730)),
+])
+def test_parse_relative_date(date_text, expected):
+    parsed = parse_relative_date(date_text)
+
+    assert abs((datetime.now() - parsed) - expected) < timedelta(seconds=5)
+
+
+@pytest.mark.parametrize("date_text", [None, "", "Promoted", "2 ngày"])
+def test_parse_relative_date_unparseable(date_text):
+    assert parse_relative_date(date_text) is None
+
+
+def test_posted_at_is_filled(fake_session):
+    fake_session(post_count=2, dates=["2d • Edited", None])
+
+    first, second = get_linkedin_updates(FEED_URL)
+
+    assert abs((datetime.now() - first['posted_at']) - timedelta(days=2)) < timedelta(seconds=5)
+    assert second['posted_at'] is None
+
+
+def test_max_days_drops_old_posts_and_keeps_unparseable(fake_session):
+    fake_session(post_count=4, dates=["2d", "3mo", "1yr", None])
+
+    posts = get_linkedin_updates(FEED_URL, max_days=30)
+
+    assert [post['urn'] for post in posts] == ["urn:li:activity:1", "urn:li:activity:4"]
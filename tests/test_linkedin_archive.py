@@ -0,0 +1,83 @@
+from datetime import datetime
+
+import os
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from linkedin_archive import PostRecord, read_posts, read_posts_table, write_posts
+
+
+FEED_URL = "https://www.linkedin.com/company/acme/posts/"
+
+
+def make_records():
+    scraped_at = datetime(2024, 12, 5, 10, 30, 15, 123456)
+    posts = [
+        {
+            'position': 1,
+            'text': "First post with a permalink",
+            'url': "https://www.linkedin.com/feed/update/urn:li:activity:1/",
+            'urn': "urn:li:activity:1",
+            'posted_at': datetime(2024, 12, 3, 10, 30, 15),
+        },
+        {
+            'position': 2,
+            'text': "Second post without a permalink",
+            'url': FEED_URL,
+        },
+    ]
+    return [PostRecord.from_post(post, "Acme", scraped_at, feed_url=FEED_URL) for post in posts]
+
+
+@pytest.mark.parametrize("filename", ["posts.arrow", "posts.parquet"])
+def test_round_trip(tmp_path, filename):
+    records = make_records()
+    path = str(tmp_path / "archive" / filename)
+
+    write_posts(records, path)
+
+    assert read_posts(path) == records
+
+
+def test_company_column_is_dictionary_encoded(tmp_path):
+    import pyarrow as pa
+
+    path = str(tmp_path / "posts.arrow")
+    write_posts(make_records(), path)
+
+    table = read_posts_table(path)
+    assert pa.types.is_dictionary(table.schema.field('company').type)
+    assert table.num_rows == 2
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc/self/fd'), reason="needs /proc to count open files")
+def test_reading_many_files_does_not_leak_handles(tmp_path):
+    path = str(tmp_path / "posts.arrow")
+    write_posts(make_records(), path)
+    read_posts_table(path)
+    open_before = len(os.listdir('/proc/self/fd'))
+
+    tables = [read_posts_table(path) for _ in range(20)]
+
+    assert len(os.listdir('/proc/self/fd')) <= open_before
+    assert all(table.num_rows == 2 for table in tables)
+
+
+def test_round_trip_empty(tmp_path):
+    path = str(tmp_path / "posts.arrow")
+
+    write_posts([], path)
+
+    assert read_posts(path) == []
+
+
+def test_only_repeated_values_are_interned():
+    first, second = make_records()
+
+    # Company and the feed-URL fallback repeat across a run; permalinks don't
+    assert first.company is second.company
+    assert second.url is PostRecord.from_post(
+        {'position': 3, 'text': "x", 'url': "".join(FEED_URL)}, "Acme", feed_url=FEED_URL
+    ).url
@@ -0,0 +1,108 @@
+import os
+import time
+
+from scrape_sharded import run_sharded, split_into_shards
+
+
+def stub_scrape(url, max_posts=10):
+    """
+    Stand-in for get_linkedin_updates. URLs look like "<behaviour>:<log dir>:<name>":
+    'ok' returns one post, 'crash' kills the worker every time, 'crash-once'
+    kills it on the first attempt only and 'hang' never returns.
+    """
+    behaviour, log_dir, name = url.split(':', 2)
+    with open(os.path.join(log_dir, 'calls.log'), 'a') as f:
+        f.write(name + '\n')
+
+    if behaviour == 'crash':
+        os._exit(1)
+    if behaviour == 'crash-once':
+        marker = os.path.join(log_dir, name + '.crashed')
+        if not os.path.exists(marker):
+            open(marker, 'w').close()
+            os._exit(1)
+    if behaviour == 'hang':
+        time.sleep(3600)
+    return [{'position': 1, 'text': f"post from {name}", 'url': url}]
+
+
+def make_companies(tmp_path, *specs):
+    return [[name, f"{behaviour}:{tmp_path}:{name}"] for behaviour, name in specs]
+
+
+def calls(tmp_path):
+    with open(os.path.join(tmp_path, 'calls.log')) as f:
+        return f.read().split()
+
+
+def texts(results):
+    return [posts[0]['text'] if posts else None for posts, scraped_at, error in results]
+
+
+def test_split_into_shards_keeps_original_indices():
+    companies = [[f"C{i}", f"u{i}"] for i in range(5)]
+
+    shards = split_into_shards(companies, 2)
+
+    assert shards == [
+        [(0, "C0", "u0"), (1, "C1", "u1")],
+        [(2, "C2", "u2"), (3, "C3", "u3")],
+        [(4, "C4", "u4")],
+    ]
+
+
+def test_results_merged_in_original_order(tmp_path):
+    companies = make_companies(tmp_path, *[('ok', f"C{i}") for i in range(7)])
+
+    results = run_sharded(companies, workers=3, min_interval=0, scrape=stub_scrape)
+
+    assert texts(results) == [f"post from C{i}" for i in range(7)]
+    assert all(error is None for posts, scraped_at, error in results)
+
+
+def test_dead_worker_shard_reassigned_without_losing_completed_work(tmp_path):
+    companies = make_companies(tmp_path, ('ok', "A"), ('crash-once', "B"), ('ok', "C"))
+
+    results = run_sharded(companies, workers=1, min_interval=0, scrape=stub_scrape)
+
+    assert texts(results) == ["post from A", "post from B", "post from C"]
+    # A finished before the crash and is not scraped again
+    assert calls(tmp_path) == ["A", "B", "B", "C"]
+
+
+def test_results_sent_just_before_crash_are_kept(tmp_path):
+    # Repeat: the fast results and the crash race the parent's reads
+    for attempt in range(10):
+        run_dir = tmp_path / str(attempt)
+        run_dir.mkdir()
+        companies = make_companies(run_dir, ('ok', "A"), ('ok', "B"), ('crash-once', "Z"), ('ok', "C"))
+
+        results = run_sharded(companies, workers=1, min_interval=0, max_attempts=1, scrape=stub_scrape)
+
+        assert texts(results)[:2] == ["post from A", "post from B"]
+        assert "worker process died" in results[2][2]
+        assert texts(results)[3] == "post from C"
+        assert calls(run_dir) == ["A", "B", "Z", "C"]
+
+
+def test_only_the_crashing_company_is_given_up_on(tmp_path):
+    companies = make_companies(tmp_path, ('crash', "A"), ('ok', "B"))
+
+    results = run_sharded(companies, workers=1, min_interval=0, max_attempts=2, scrape=stub_scrape)
+
+    (a_posts, _, a_error), (b_posts, _, b_error) = results
+    assert a_posts == [] and "worker process died" in a_error
+    assert b_error is None and texts(results)[1] == "post from B"
+    assert calls(tmp_path) == ["A", "A", "B"]
+
+
+def test_watchdog_stops_hung_worker(tmp_path):
+    companies = make_companies(tmp_path, ('hang', "A"), ('ok', "B"))
+
+    started = time.time()
+    results = run_sharded(companies, workers=1, min_interval=0, max_attempts=1,
+                          company_timeout=1, scrape=stub_scrape)
+
+    assert time.time() - started < 30
+    assert "timed out" in results[0][2]
+    assert texts(results)[1] == "post from B"